@@ -31,7 +31,7 @@ XDGFX, 2026 (csv import plugin)
 
 import csv
 import os
-import glob
+from functools import lru_cache
 
 from ultrasonics import logs
 from ultrasonics.tools import name_filter
@@ -77,6 +77,13 @@ handshake = {
             "id": "has_header",
             "options": ["Yes", "No"],
         },
+        {
+            "type": "radio",
+            "label": "Strip Whitespace Around Cells",
+            "name": "strip_whitespace",
+            "id": "strip_whitespace",
+            "options": ["Yes", "No"],
+        },
         {
             "type": "radio",
             "label": "Playlist Name Source",
@@ -88,6 +95,10 @@ handshake = {
             "type": "string",
             "value": "If you disable the header row, the plugin will assume the columns are in the default order documented in the plugin description.",
         },
+        {
+            "type": "string",
+            "value": "Whitespace around cells is stripped by default, and blank cells are ignored. If your CSV is a clean export (such as Exportify) with no spaces around values, you can disable stripping to speed up large imports.",
+        },
         {
             "type": "string",
             "value": "You can optionally override the expected column names below. Leave blank to use the defaults.",
@@ -159,83 +170,170 @@ handshake = {
     ],
 }
 
+# Read CSV files in 1 MiB blocks, to cut down on read syscalls for large files
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Track columns in the documented order, also used as positions when the CSV has no header row.
+_TRACK_FIELDS = (
+    "title",
+    "artists",
+    "album",
+    "date",
+    "isrc",
+    "location",
+    "spotify_id",
+    "tidal_id",
+)
+_NO_HEADER_IDX = {name: i for i, name in enumerate(_TRACK_FIELDS)}
+_NO_HEADER_MULTI_IDX = {
+    name: i for i, name in enumerate(("playlist",) + _TRACK_FIELDS)
+}
 
-def _get_field_name(settings_dict, key, default):
-    """
-    Helper to read a configurable column name from settings, falling back to a default.
-    """
-    value = (settings_dict.get(key) or "").strip()
-    return value or default
 
+# Configurable columns: (field, settings key, default column name)
+_FIELD_SETTINGS = (
+    ("playlist", "col_playlist", "playlist"),
+    ("title", "col_title", "Track Name"),
+    ("artists", "col_artists", "Artist Name"),
+    ("album", "col_album", "Album Name"),
+    ("date", "col_date", "date"),
+    ("isrc", "col_isrc", "isrc"),
+    ("location", "col_location", "location"),
+    ("spotify_id", "col_spotify_id", "Track ID"),
+    ("tidal_id", "col_tidal_id", "tidal_id"),
+)
 
-def _get_cell(row, header_map, configured_name):
+
+@lru_cache(maxsize=32)
+def _resolve_field_names(configured):
     """
-    Helper to get a cell from a DictReader row using a case-insensitive
-    column name lookup.
+    Resolve the configured column names (a tuple of the raw settings values, in
+    _FIELD_SETTINGS order), falling back to the defaults for blank settings.
+    The returned dict is shared between runs with the same settings, so treat it as read-only.
     """
-    key = (configured_name or "").strip()
-    if not key:
-        return ""
-
-    if header_map:
-        actual = header_map.get(key.lower(), key)
-    else:
-        actual = key
-
-    return (row.get(actual) or "").strip()
+    return {
+        field: (value or "").strip() or default
+        for (field, _, default), value in zip(_FIELD_SETTINGS, configured)
+    }
 
 
-def _row_to_track(row, field_names, header_map=None):
+def _resolve_fields(header, field_names):
     """
-    Convert a CSV row (dict) into a single track entry in ultrasonics songs_dict format.
+    Resolve every configured column name to its index in the header row, using a
+    case-insensitive match. Called once per file; columns not found resolve to -1.
     """
-    title = _get_cell(row, header_map, field_names["title"])
-    if not title:
-        # Skip rows without a title
-        return None
+    # Lowercased header name -> column index. The last occurrence of a duplicated
+    # name wins, as it did with csv.DictReader.
+    header_map = {}
+    for i, h in enumerate(header):
+        header_map[h.strip().lower()] = i
 
-    track = {
-        "title": title,
+    return {
+        name: header_map.get(cfg.strip().lower(), -1)
+        for name, cfg in field_names.items()
     }
 
-    # Artists, as a list of names split on ';'
-    artists_raw = _get_cell(row, header_map, field_names["artists"])
-    if artists_raw:
-        artists = [a.strip() for a in artists_raw.split(";") if a.strip()]
-        if artists:
-            track["artists"] = artists
-
-    album = _get_cell(row, header_map, field_names["album"])
-    if album:
-        track["album"] = album
 
-    date = _get_cell(row, header_map, field_names["date"])
-    if date:
-        track["date"] = date
-
-    isrc = _get_cell(row, header_map, field_names["isrc"])
-    if isrc:
-        track["isrc"] = isrc
-
-    location = _get_cell(row, header_map, field_names["location"])
-    if location:
-        track["location"] = location
+def _cell_at(row, index, strip):
+    """
+    Helper to get a cell from a csv.reader row by column index.
+    Missing columns (index -1, or beyond the end of a short row) return "".
+    """
+    if 0 <= index < len(row):
+        return row[index].strip() if strip else row[index]
+    return ""
 
-    spotify_id = _get_cell(row, header_map, field_names["spotify_id"])
-    tidal_id = _get_cell(row, header_map, field_names["tidal_id"])
 
-    ids = {}
-    if spotify_id:
-        ids["spotify"] = spotify_id
-    if tidal_id:
-        ids["tidal"] = tidal_id
-    if ids:
-        track["id"] = ids
+@lru_cache(maxsize=32)
+def _make_row_converter(
+    title, artists, album, date, isrc, location, spotify_id, tidal_id, strip
+):
+    """
+    Build a function converting a CSV row (list) into a single track entry in ultrasonics
+    songs_dict format, specialised for one set of column indices.
+    Columns missing from the file (index -1) are dropped here rather than checked on every row.
+    Cells are only stripped if `strip` is set; names split from a multi-artist cell always are,
+    and a whitespace-only title still counts as missing.
+    """
+    if title < 0:
+        # Without a title column every row would be skipped
+        return lambda row: None
+
+    fields = tuple(
+        (key, i)
+        for key, i in (
+            ("album", album),
+            ("date", date),
+            ("isrc", isrc),
+            ("location", location),
+        )
+        if i >= 0
+    )
+    id_fields = tuple(
+        (key, i) for key, i in (("spotify", spotify_id), ("tidal", tidal_id)) if i >= 0
+    )
+
+    def row_to_track(row):
+        n = len(row)
+        if title >= n:
+            return None
+
+        value = row[title]
+        if strip:
+            value = value.strip()
+        if not value or value.isspace():
+            # Skip rows without a title, even when cells are not being stripped
+            return None
+
+        track = {
+            "title": value,
+        }
 
-    return track
+        # Artists, as a list of names split on ';'
+        if 0 <= artists < n:
+            artists_raw = row[artists]
+            if strip:
+                artists_raw = artists_raw.strip()
+            if ";" in artists_raw:
+                names = [a for a in (s.strip() for s in artists_raw.split(";")) if a]
+                if names:
+                    track["artists"] = names
+            elif artists_raw:
+                # Single artist, the common case: nothing to split
+                track["artists"] = [artists_raw]
+
+        for key, i in fields:
+            if i < n:
+                value = row[i]
+                if strip:
+                    value = value.strip()
+                if value:
+                    track[key] = value
+
+        ids = {}
+        for key, i in id_fields:
+            if i < n:
+                value = row[i]
+                if strip:
+                    value = value.strip()
+                if value:
+                    ids[key] = value
+        if ids:
+            track["id"] = ids
+
+        return track
+
+    return row_to_track
+
+
+def _row_converter(idx, strip):
+    """
+    Return the (cached) row converter for a resolved column index map.
+    """
+    return _make_row_converter(*(idx[name] for name in _TRACK_FIELDS), strip)
 
 
-def _read_one_csv_as_playlist(path, delimiter, has_header, field_names):
+def _read_one_csv_as_playlist(path, delimiter, has_header, field_names, strip_whitespace):
     """
     Read a single CSV file with "From file name" semantics.
     Returns one playlist dict {"name": ..., "id": {}, "songs": [...]} or None if no tracks.
@@ -243,36 +341,27 @@ def _read_one_csv_as_playlist(path, delimiter, has_header, field_names):
     playlist_name = os.path.splitext(os.path.basename(path))[0]
     tracks = []
 
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as f:
         if has_header:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            header_map = {h.lower(): h for h in (reader.fieldnames or []) if h}
+            reader = csv.reader(f, delimiter=delimiter)
+            row_to_track = _row_converter(
+                _resolve_fields(next(reader, []), field_names), strip_whitespace
+            )
 
             for row in reader:
-                track = _row_to_track(row, field_names, header_map=header_map)
+                track = row_to_track(row)
                 if not track:
                     continue
                 tracks.append(track)
         else:
             reader = csv.reader(f, delimiter=delimiter)
+            row_to_track = _row_converter(_NO_HEADER_IDX, strip_whitespace)
             for row in reader:
-                if not row or all(not (cell or "").strip() for cell in row):
+                if not row or not any(cell and cell.strip() for cell in row):
                     continue
 
-                padded = list(row) + ["" for _ in range(max(0, 8 - len(row)))]
-
-                row_dict = {
-                    field_names["title"]: padded[0],
-                    field_names["artists"]: padded[1],
-                    field_names["album"]: padded[2],
-                    field_names["date"]: padded[3],
-                    field_names["isrc"]: padded[4],
-                    field_names["location"]: padded[5],
-                    field_names["spotify_id"]: padded[6],
-                    field_names["tidal_id"]: padded[7],
-                }
-
-                track = _row_to_track(row_dict, field_names)
+                # Short rows need no padding, the converter treats missing columns as empty
+                track = row_to_track(row)
                 if not track:
                     continue
 
@@ -287,12 +376,40 @@ def _read_one_csv_as_playlist(path, delimiter, has_header, field_names):
     }
 
 
+def _playlist_songs(playlists, name):
+    """
+    Return the songs list for a playlist, creating the playlist entry on first use.
+    """
+    playlist = playlists.get(name)
+    if playlist is None:
+        playlist = playlists[name] = {
+            "name": name,
+            "id": {},
+            "songs": [],
+        }
+    return playlist["songs"]
+
+
+def _is_csv_name(name):
+    """
+    Check a file name is a visible .csv file, skipping hidden files
+    such as macOS '._' resource forks (as glob did).
+    """
+    return name.endswith(".csv") and not name.startswith(".")
+
+
 def _csv_files_in_folder(folder_path, include_subfolders):
     """Return sorted list of .csv file paths in folder (optionally in subfolders)."""
     if include_subfolders:
-        pattern = os.path.join(folder_path, "**", "*.csv")
-        return sorted(glob.glob(pattern))
-    return sorted(glob.glob(os.path.join(folder_path, "*.csv")))
+        csv_paths = []
+        for root, dirs, files in os.walk(folder_path):
+            # Don't descend into hidden folders
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            csv_paths.extend(os.path.join(root, f) for f in files if _is_csv_name(f))
+        return sorted(csv_paths)
+
+    with os.scandir(folder_path) as entries:
+        return sorted(e.path for e in entries if _is_csv_name(e.name) and e.is_file())
 
 
 def run(settings_dict, **kwargs):
@@ -325,19 +442,12 @@ def run(settings_dict, **kwargs):
     has_header = (settings_dict.get("has_header") or "Yes") == "Yes"
     playlist_source = (settings_dict.get("playlist_source") or "From file name").strip()
     include_subfolders = (settings_dict.get("include_subfolders") or "No") == "Yes"
+    strip_whitespace = (settings_dict.get("strip_whitespace") or "Yes") == "Yes"
 
     # Resolve column names
-    field_names = {
-        "playlist": _get_field_name(settings_dict, "col_playlist", "playlist"),
-        "title": _get_field_name(settings_dict, "col_title", "Track Name"),
-        "artists": _get_field_name(settings_dict, "col_artists", "Artist Name"),
-        "album": _get_field_name(settings_dict, "col_album", "Album Name"),
-        "date": _get_field_name(settings_dict, "col_date", "date"),
-        "isrc": _get_field_name(settings_dict, "col_isrc", "isrc"),
-        "location": _get_field_name(settings_dict, "col_location", "location"),
-        "spotify_id": _get_field_name(settings_dict, "col_spotify_id", "Track ID"),
-        "tidal_id": _get_field_name(settings_dict, "col_tidal_id", "tidal_id"),
-    }
+    field_names = _resolve_field_names(
+        tuple(settings_dict.get(key) for _, key, _ in _FIELD_SETTINGS)
+    )
 
     songs_dict = []
 
@@ -346,10 +456,11 @@ def run(settings_dict, **kwargs):
         csv_paths = _csv_files_in_folder(path, include_subfolders)
         if not csv_paths:
             log.warning(f"No CSV files found in folder: {path}")
+
         for csv_path in csv_paths:
             try:
                 playlist = _read_one_csv_as_playlist(
-                    csv_path, delimiter, has_header, field_names
+                    csv_path, delimiter, has_header, field_names, strip_whitespace
                 )
                 if playlist:
                     songs_dict.append(playlist)
@@ -359,7 +470,7 @@ def run(settings_dict, **kwargs):
     # --- Single file: playlist name from file name (Exportify style) ---
     elif playlist_source == "From file name":
         playlist = _read_one_csv_as_playlist(
-            path, delimiter, has_header, field_names
+            path, delimiter, has_header, field_names, strip_whitespace
         )
         if playlist:
             songs_dict.append(playlist)
@@ -367,68 +478,56 @@ def run(settings_dict, **kwargs):
     # --- Single file: playlist name from CSV column (multi-playlist CSV) ---
     else:
         playlists = {}
+        # Rows of one playlist are usually contiguous, so only look up the
+        # playlist entry when the name changes from the previous row.
+        current_name = None
+        current_songs = None
 
-        with open(path, "r", encoding="utf-8") as f:
+        with open(path, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER_SIZE) as f:
             if has_header:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                header_map = {h.lower(): h for h in (reader.fieldnames or []) if h}
+                reader = csv.reader(f, delimiter=delimiter)
+                idx = _resolve_fields(next(reader, []), field_names)
+                row_to_track = _row_converter(idx, strip_whitespace)
 
                 for row in reader:
-                    playlist_name = _get_cell(
-                        row, header_map, field_names["playlist"]
-                    )
+                    playlist_name = _cell_at(row, idx["playlist"], strip_whitespace)
                     if not playlist_name:
                         continue
 
-                    track = _row_to_track(row, field_names, header_map=header_map)
+                    track = row_to_track(row)
                     if not track:
                         continue
 
-                    playlists.setdefault(playlist_name, []).append(track)
+                    if playlist_name != current_name:
+                        current_name = playlist_name
+                        current_songs = _playlist_songs(playlists, playlist_name)
+                    current_songs.append(track)
             else:
                 # No header: use fixed positional mapping in the documented order
                 reader = csv.reader(f, delimiter=delimiter)
+                row_to_track = _row_converter(_NO_HEADER_MULTI_IDX, strip_whitespace)
                 for row in reader:
-                    if not row or all(not (cell or "").strip() for cell in row):
+                    if not row or not any(cell and cell.strip() for cell in row):
                         continue
 
                     # Minimum expected columns: playlist, title
                     if len(row) < 2:
                         continue
 
-                    # Pad row to expected length
-                    padded = list(row) + ["" for _ in range(max(0, 9 - len(row)))]
-
-                    playlist_name = (padded[0] or "").strip()
+                    playlist_name = row[0].strip() if strip_whitespace else row[0]
                     if not playlist_name:
                         continue
 
-                    row_dict = {
-                        field_names["playlist"]: padded[0],
-                        field_names["title"]: padded[1],
-                        field_names["artists"]: padded[2],
-                        field_names["album"]: padded[3],
-                        field_names["date"]: padded[4],
-                        field_names["isrc"]: padded[5],
-                        field_names["location"]: padded[6],
-                        field_names["spotify_id"]: padded[7],
-                        field_names["tidal_id"]: padded[8],
-                    }
-
-                    track = _row_to_track(row_dict, field_names)
+                    track = row_to_track(row)
                     if not track:
                         continue
 
-                    playlists.setdefault(playlist_name, []).append(track)
+                    if playlist_name != current_name:
+                        current_name = playlist_name
+                        current_songs = _playlist_songs(playlists, playlist_name)
+                    current_songs.append(track)
 
-        for name, tracks in playlists.items():
-            songs_dict.append(
-                {
-                    "name": name,
-                    "id": {},
-                    "songs": tracks,
-                }
-            )
+        songs_dict.extend(playlists.values())
 
     # Apply regex filter if provided
     regex = (settings_dict.get("filter") or "").strip()
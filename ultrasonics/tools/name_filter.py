@@ -4,8 +4,9 @@
 name_filter
 Filters a playlist list using regex on playlist titles.
 
-Takes a list of input playlists, and a standard regex string.
-Returns all playlists where the names match the supplied regex.
+Takes a list of input playlists, and a standard regex string (or a pattern
+already compiled with re.compile). Returns all playlists where the names
+match the supplied regex.
 
 XDGFX, 2020
 """
@@ -14,14 +15,26 @@ import re
 import os
 
 
+def _compile(regex):
+    """
+    Compiles the regex once per filter call, rather than once per playlist.
+    Precompiled patterns are used as they are.
+    """
+    if isinstance(regex, re.Pattern):
+        return regex
+
+    return re.compile(regex, re.IGNORECASE)
+
+
 def filter_list(playlists, regex):
     """
     Takes a list input of *playlist names* to filter.
     """
+    pattern = _compile(regex)
     new_playlists = []
 
     for playlist in playlists:
-        if re.match(regex, playlist, re.IGNORECASE):
+        if pattern.match(playlist):
             new_playlists.append(playlist)
 
     return new_playlists
@@ -31,13 +44,14 @@ def filter_path(playlists, regex):
     """
     Takes a list input of *playlist directory paths* to filter.
     """
+    pattern = _compile(regex)
     new_playlists = []
 
     for path in playlists:
         base_name = os.path.basename(path)
         playlist = os.path.splitext(base_name)[0]
 
-        if re.match(regex, playlist, re.IGNORECASE):
+        if pattern.match(playlist):
             new_playlists.append(path)
 
     return new_playlists
@@ -47,10 +61,11 @@ def filter(songs_dict, regex):
     """
     Takes a standard songs_dict to filter.
     """
+    pattern = _compile(regex)
     new_playlists = []
 
     for playlist in songs_dict:
-        if re.match(regex, playlist["name"], re.IGNORECASE):
+        if pattern.match(playlist["name"]):
             new_playlists.append(playlist)
 
     return new_playlists